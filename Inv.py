@@ -1,5 +1,15 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import hashlib
+import multiprocessing
+import os
+import posixpath
+import queue
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import pandas as pd
 from datetime import datetime
 import matplotlib.pyplot as plt
@@ -9,6 +19,68 @@ from matplotlib.gridspec import GridSpec
 import seaborn as sns
 
 
+MONTH_COLUMNS = ["Item", "Unidades Produzidas", "Unidades Vendidas", "Preço (R$)", "Custo (R$)"]
+WATCH_INTERVAL = 2.0
+WATCH_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def read_month_sheet(source, sheet):
+    """Read one month sheet as a list of [item, produced, sold, price, cost] rows"""
+    df = pd.read_excel(source, sheet_name=sheet)
+    df = df.loc[:, ~df.columns.str.contains('^Unnamed')]
+    return df[MONTH_COLUMNS].values.tolist()
+
+
+def hash_workbook_sheets(file_path):
+    """Hash the cell contents of every sheet in an .xlsx without parsing it with pandas.
+
+    Only each cell's reference, type and value feed the hash, with shared strings
+    resolved to their text. A sheet's hash therefore changes only when its own cells
+    change, not when the shared-string table is rebuilt or the view state is saved.
+    """
+    with zipfile.ZipFile(file_path) as zf:
+        names = set(zf.namelist())
+        workbook = ET.fromstring(zf.read("xl/workbook.xml"))
+        rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+        targets = {rel.get("Id"): rel.get("Target") for rel in rels.iterfind("{*}Relationship")}
+
+        shared_strings = []
+        if "xl/sharedStrings.xml" in names:
+            sst = ET.fromstring(zf.read("xl/sharedStrings.xml"))
+            shared_strings = ["".join(si.itertext()) for si in sst.iterfind("{*}si")]
+
+        hashes = {}
+        for sheet in workbook.iterfind("{*}sheets/{*}sheet"):
+            rel_id = next((v for k, v in sheet.attrib.items() if k.endswith("}id")), None)
+            target = targets.get(rel_id)
+            if not target:
+                continue
+            if target.startswith("/"):
+                part = target.lstrip("/")
+            else:
+                part = posixpath.normpath(posixpath.join("xl", target))
+            if part not in names:
+                continue
+
+            digest = hashlib.sha1()
+            for cell in ET.fromstring(zf.read(part)).iterfind("{*}sheetData/{*}row/{*}c"):
+                cell_type = cell.get("t", "n")
+                inline = cell.find("{*}is")
+                if inline is not None:
+                    value = "".join(inline.itertext())
+                else:
+                    value = cell.findtext("{*}v") or ""
+                    if cell_type == "s":
+                        # A malformed or out-of-range index is hashed as-is rather than failing the file
+                        try:
+                            value = shared_strings[int(value)]
+                        except (ValueError, IndexError):
+                            pass
+                digest.update(f"{cell.get('r')}\0{cell_type}\0{value}\x1e".encode("utf-8"))
+            hashes[sheet.get("name")] = digest.hexdigest()
+        return hashes
+
+
 class InventoryApp:
     def __init__(self, root):
         self.root = root
@@ -24,6 +96,13 @@ class InventoryApp:
         self.monthly_data = {month: [] for month in self.portuguese_months}
         self.current_month = self.translate_month(datetime.now().month)
 
+        # Watch mode state
+        self.watch_thread = None
+        self.watch_stop = None
+        self.watch_executor = None
+        self.watch_queue = None
+        self.watch_after_id = None
+
         self.create_widgets()
         self.change_analysis()
 
@@ -47,6 +126,9 @@ class InventoryApp:
         self.selector.pack(side=tk.LEFT, padx=10)
         self.selector.bind("<<ComboboxSelected>>", self.change_analysis)
 
+        self.watch_status = tk.Label(self.control_frame, text="")
+        self.watch_status.pack(side=tk.LEFT, padx=10)
+
         # Treeview setup
         self.tree_frame = tk.Frame(self.root)
         self.tree_frame.pack(pady=10, fill=tk.BOTH, expand=True)
@@ -115,6 +197,10 @@ class InventoryApp:
             btn = tk.Button(self.button_frame, text=text, command=cmd)
             btn.grid(row=0, column=i, padx=5)
 
+        # Watch toggle keeps a reference so its label can switch between Monitorar/Parar
+        self.watch_button = tk.Button(self.button_frame, text="👁️ Monitorar", command=self.toggle_watch)
+        self.watch_button.grid(row=0, column=len(buttons), padx=5)
+
     def change_analysis(self, event=None):
         selection = self.analysis_var.get()
         if selection in self.portuguese_months:
@@ -278,17 +364,154 @@ class InventoryApp:
             xls = pd.ExcelFile(file_path)
             for sheet in xls.sheet_names:
                 if sheet in self.monthly_data.keys():
-                    df = pd.read_excel(xls, sheet_name=sheet)
-                    df = df.loc[:, ~df.columns.str.contains('^Unnamed')]
-                    self.monthly_data[sheet] = df[
-                        ["Item", "Unidades Produzidas", "Unidades Vendidas",
-                         "Preço (R$)", "Custo (R$)"]].values.tolist()
+                    self.monthly_data[sheet] = read_month_sheet(xls, sheet)
 
             self.change_analysis()
             messagebox.showinfo("Sucesso", "Dados importados com sucesso!")
         except Exception as e:
             messagebox.showerror("Erro", f"Falha na importação:\n{str(e)}")
 
+    def toggle_watch(self):
+        if self.watch_thread is not None:
+            self.stop_watch()
+            return
+
+        folder = filedialog.askdirectory(title="Pasta a monitorar")
+        if not folder:
+            return
+
+        # Each session gets its own queue so results from a stopped watcher are never merged
+        self.watch_stop = threading.Event()
+        self.watch_queue = queue.Queue()
+        # Spawn rather than fork: the pool is first used from the watcher thread of a Tk process
+        self.watch_executor = ProcessPoolExecutor(
+            max_workers=WATCH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        self.watch_thread = threading.Thread(
+            target=self.watch_loop,
+            args=(folder, self.watch_executor, self.watch_stop, self.watch_queue),
+            daemon=True
+        )
+        self.watch_thread.start()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        self.watch_button.config(text="⏹️ Parar")
+        self.watch_status.config(text=f"Monitorando: {os.path.basename(folder) or folder}")
+        self.watch_after_id = self.root.after(500, self.process_watch_queue, self.watch_queue)
+
+    def stop_watch(self):
+        if self.watch_thread is not None:
+            self.watch_stop.set()
+            self.watch_executor.shutdown(wait=False, cancel_futures=True)
+        if self.watch_after_id is not None:
+            self.root.after_cancel(self.watch_after_id)
+        self.watch_thread = None
+        self.watch_stop = None
+        self.watch_executor = None
+        self.watch_queue = None
+        self.watch_after_id = None
+        self.watch_button.config(text="👁️ Monitorar")
+        self.watch_status.config(text="")
+
+    def on_close(self):
+        self.stop_watch()
+        self.root.destroy()
+
+    def watch_loop(self, folder, executor, stop, messages):
+        """Background thread: poll the folder and re-parse only the month sheets that changed"""
+        watched_files = {}
+        sheet_hashes = {}
+        while not stop.is_set():
+            try:
+                self.scan_watch_folder(folder, executor, stop, messages, watched_files, sheet_hashes)
+            except BrokenProcessPool:
+                if not stop.is_set():
+                    messages.put(("stopped", "Monitoramento interrompido: processo de leitura falhou"))
+                return
+            except Exception as e:
+                if not stop.is_set():
+                    messages.put(("error", f"Erro ao monitorar: {e}"))
+            stop.wait(WATCH_INTERVAL)
+
+    def scan_watch_folder(self, folder, executor, stop, messages, watched_files, sheet_hashes):
+        current = {}
+        for name in os.listdir(folder):
+            # Skip Excel lock files ("~$arquivo.xlsx")
+            if name.lower().endswith(".xlsx") and not name.startswith("~$"):
+                path = os.path.join(folder, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                current[path] = (stat.st_mtime_ns, stat.st_size)
+
+        for path in set(watched_files) - set(current):
+            del watched_files[path]
+            sheet_hashes.pop(path, None)
+
+        for path in sorted(current, key=lambda p: current[p]):
+            if stop.is_set():
+                return
+            if watched_files.get(path) == current[path]:
+                continue
+
+            try:
+                hashes = hash_workbook_sheets(path)
+            except (zipfile.BadZipFile, KeyError, ET.ParseError, OSError):
+                # Still being copied or not a valid workbook; retry on the next poll
+                continue
+            # Sheets that fail to parse are only retried once the file changes again
+            watched_files[path] = current[path]
+
+            known = sheet_hashes.get(path, {})
+            changed = [sheet for sheet, digest in hashes.items()
+                       if sheet in self.monthly_data and known.get(sheet) != digest]
+
+            futures = {sheet: executor.submit(read_month_sheet, path, sheet) for sheet in changed}
+            updates = {}
+            for sheet, future in futures.items():
+                try:
+                    updates[sheet] = future.result()
+                except CancelledError:
+                    return
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    messages.put(("error", f"Falha em {os.path.basename(path)} ({sheet}): {e}"))
+
+            # Failed sheets are left unhashed so the next change to the file retries them
+            sheet_hashes[path] = {sheet: digest for sheet, digest in hashes.items()
+                                  if sheet not in changed or sheet in updates}
+            if updates and not stop.is_set():
+                messages.put(("data", (path, updates)))
+
+    def process_watch_queue(self, messages):
+        """Merge results from the watcher into monthly_data on the Tk thread"""
+        self.watch_after_id = None
+        refreshed = False
+        while messages is self.watch_queue:
+            try:
+                kind, payload = messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "data":
+                path, updates = payload
+                self.monthly_data.update(updates)
+                refreshed = True
+                self.watch_status.config(
+                    text=f"{os.path.basename(path)}: {', '.join(updates)} ({datetime.now():%H:%M:%S})")
+            elif kind == "stopped":
+                self.stop_watch()
+                self.watch_status.config(text=payload)
+            else:
+                self.watch_status.config(text=payload)
+
+        if refreshed:
+            self.change_analysis()
+        if messages is self.watch_queue:
+            self.watch_after_id = self.root.after(500, self.process_watch_queue, messages)
+
     def add_item(self):
         try:
             item = self.entries["Item"].get().strip()